@@ -1,3 +1,5 @@
+import functools
+import json
 import logging
 import os
 import pathlib
@@ -11,13 +13,18 @@ from audible.exceptions import FileEncryptionError
 
 from . import __version__
 from .constants import (
+    AUTH_FILE_PASSWORD_ATTEMPTS,
     CONFIG_DIR_ENV,
     CONFIG_FILE,
-    DEFAULT_CONFIG_DATA,
+    DEFAULT_CONFIG_JSON,
     PLUGIN_DIR_ENV,
     PLUGIN_PATH
 )
-from .exceptions import AudibleCliException, ProfileAlreadyExists
+from .exceptions import (
+    AudibleCliException,
+    FileDoesNotExists,
+    ProfileAlreadyExists
+)
 
 
 logger = logging.getLogger("audible_cli.config")
@@ -40,14 +47,15 @@ class ConfigFile:
             is loaded.
     """
 
+    __slots__ = ("_config_file", "_config_data")
+
     def __init__(
             self,
             filename: Union[str, pathlib.Path],
             file_exists: bool = True
     ) -> None:
-        filename = pathlib.Path(filename).resolve()
-        config_data = DEFAULT_CONFIG_DATA.copy()
-        file_data = {}
+        filename = pathlib.Path(os.path.abspath(filename))
+        config_data = {}
 
         if file_exists:
             if not filename.is_file():
@@ -55,13 +63,14 @@ class ConfigFile:
                     f"Config file {click.format_filename(filename)} "
                     f"does not exists"
                 )
-            file_data = toml.load(filename)
+            config_data = toml.load(filename)
             logger.debug(
                 f"Config loaded from "
                 f"{click.format_filename(filename, shorten=True)}"
             )
 
-        config_data.update(file_data)
+        for key, value in json.loads(DEFAULT_CONFIG_JSON).items():
+            config_data.setdefault(key, value)
 
         self._config_file = filename
         self._config_data = config_data
@@ -106,9 +115,10 @@ class ConfigFile:
 
     @property
     def primary_profile(self) -> str:
-        if "primary_profile" not in self.app_config:
+        primary_profile = self.app_config.get("primary_profile")
+        if primary_profile is None:
             raise AudibleCliException("No primary profile set in config")
-        return self.app_config["primary_profile"]
+        return primary_profile
 
     def get_profile_option(
             self,
@@ -203,12 +213,12 @@ class ConfigFile:
             filename: If not ``None`` the config is written to these file path 
                 instead of ``self.filename``
         """
-        f = pathlib.Path(filename or self.filename).resolve()
+        f = pathlib.Path(os.path.abspath(filename or self.filename))
 
-        if not f.parent.is_dir():
-            f.parent.mkdir(parents=True)
+        f.parent.mkdir(parents=True, exist_ok=True)
 
-        toml.dump(self.data, f.open("w"))
+        with f.open("w", encoding="utf-8", buffering=65536) as fp:
+            toml.dump(self.data, fp)
 
         click_f = click.format_filename(f, shorten=True)
         logger.info(f"Config written to {click_f}")
@@ -216,6 +226,9 @@ class ConfigFile:
 
 class Session:
     """Holds the settings for the current session"""
+
+    __slots__ = ("_auths", "_config", "_params", "_app_dir", "_plugin_dir")
+
     def __init__(self) -> None:
         self._auths: Dict[str, Authenticator] = {}
         self._config: Optional[CONFIG_FILE] = None
@@ -299,10 +312,14 @@ class Session:
         auth_file = self.config.get_profile_option(profile, "auth_file")
         country_code = self.config.get_profile_option(profile, "country_code")
 
-        while True:
+        auth_file_path = self.config.dirname / auth_file
+        if not auth_file_path.is_file():
+            raise FileDoesNotExists(auth_file_path)
+
+        for attempt in range(AUTH_FILE_PASSWORD_ATTEMPTS + 1):
             try:
                 auth = Authenticator.from_file(
-                    filename=self.config.dirname / auth_file,
+                    filename=auth_file_path,
                     password=password,
                     locale=country_code)
                 break
@@ -310,6 +327,10 @@ class Session:
                 logger.info(
                     "Auth file is encrypted but no/wrong password is provided"
                 )
+                if attempt == AUTH_FILE_PASSWORD_ATTEMPTS:
+                    raise AudibleCliException(
+                        "Too many wrong password attempts for auth file"
+                    )
                 password = click.prompt(
                     "Please enter the auth-file password (or enter to exit)",
                     hide_input=True,
@@ -346,13 +367,15 @@ class Session:
         return self.get_client_for_profile(profile, password, **kwargs)
 
 
+@functools.lru_cache(maxsize=None)
 def get_app_dir() -> pathlib.Path:
     app_dir = os.getenv(CONFIG_DIR_ENV) or click.get_app_dir(
         "Audible", roaming=False, force_posix=True
     )
-    return pathlib.Path(app_dir).resolve()
+    return pathlib.Path(os.path.abspath(app_dir))
 
 
+@functools.lru_cache(maxsize=None)
 def get_plugin_dir() -> pathlib.Path:
     plugin_dir = os.getenv(PLUGIN_DIR_ENV) or (get_app_dir() / PLUGIN_PATH)
-    return pathlib.Path(plugin_dir).resolve()
+    return pathlib.Path(os.path.abspath(plugin_dir))
@@ -1,4 +1,5 @@
-from typing import Dict
+import json
+from typing import Any, Dict
 
 from audible.localization import LOCALE_TEMPLATES
 
@@ -11,11 +12,11 @@ PLUGIN_DIR_ENV: str = "AUDIBLE_PLUGIN_DIR"
 PLUGIN_ENTRY_POINT: str = "audible.cli_plugins"
 DEFAULT_AUTH_FILE_EXTENSION: str = "json"
 DEFAULT_AUTH_FILE_ENCRYPTION: str = "json"
-DEFAULT_CONFIG_DATA: Dict[str, str] = {
-    "title": "Audible Config File",
-    "APP": {},
-    "profile": {}
-}
+AUTH_FILE_PASSWORD_ATTEMPTS: int = 3
+DEFAULT_CONFIG_JSON: str = (
+    '{"title": "Audible Config File", "APP": {}, "profile": {}}'
+)
+DEFAULT_CONFIG_DATA: Dict[str, Any] = json.loads(DEFAULT_CONFIG_JSON)
 CODEC_HIGH_QUALITY: str = "AAX_44_128"
 CODEC_NORMAL_QUALITY: str = "AAX_44_64"
 
@@ -32,7 +32,7 @@ def from_folder(plugin_dir: Union[str, pathlib.Path]):
                 "Plugins can only be attached to an instance of click.Group()"
             )
 
-        plugin_path = pathlib.Path(plugin_dir).resolve()
+        plugin_path = pathlib.Path(os.path.abspath(plugin_dir))
         sys.path.insert(0, str(plugin_path))
 
         for cmd_path in plugin_path.glob("cmd_*.py"):